@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import os
 import textwrap
 from typing import Optional
@@ -15,27 +16,67 @@ from pants.backend.python.target_types import (
     ResolvePexEntryPointRequest,
 )
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
-from pants.backend.python.util_rules.local_dists import LocalDistsPex, LocalDistsPexRequest
+from pants.backend.python.util_rules.local_dists import (
+    LocalDistsPex,
+    LocalDistsPexWithSourcesRequest,
+)
 from pants.backend.python.util_rules.pex import Pex, PexRequest, VenvPex, VenvPexRequest
 from pants.backend.python.util_rules.pex_environment import PexEnvironment
 from pants.backend.python.util_rules.pex_from_targets import (
     InterpreterConstraintsRequest,
     PexFromTargetsRequest,
 )
-from pants.backend.python.util_rules.python_sources import (
-    PythonSourceFiles,
-    PythonSourceFilesRequest,
-)
 from pants.core.goals.run import RunDebugAdapterRequest, RunRequest
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
 from pants.engine.addresses import Address
 from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
 from pants.engine.rules import Get, MultiGet, rule_helper
-from pants.engine.target import TransitiveTargets, TransitiveTargetsRequest
+
+# The launcher script and its path are static, so the `FileContent` is only built once, at import
+# time.
+_DEBUGPY_LAUNCHER = FileContent(
+    "__debugpy_launcher.py",
+    textwrap.dedent(
+        """
+        import os
+        CHROOT = os.environ["PANTS_CHROOT"]
+
+        del os.environ["PEX_INTERPRETER"]
+
+        # See https://github.com/pantsbuild/pants/issues/17540
+        # For `run --debug-adapter`, the client might send a `pathMappings`
+        # (this is likely as VS Code likes to configure that by default) with
+        # a `remoteRoot` of ".". For `run`, CWD is set to the build root, so
+        # breakpoints set in-repo will never be hit. We fix this by monkeypatching
+        # pydevd (the library powering debugpy) so that a remoteRoot of "."
+        # means the sandbox root.
+
+        import debugpy._vendored.force_pydevd
+        from _pydevd_bundle.pydevd_process_net_command_json import PyDevJsonCommandProcessor
+        orig_resolve_remote_root = PyDevJsonCommandProcessor._resolve_remote_root
+
+        def patched_resolve_remote_root(self, local_root, remote_root):
+            if remote_root == ".":
+                remote_root = CHROOT
+            return orig_resolve_remote_root(self, local_root, remote_root)
+
+        PyDevJsonCommandProcessor._resolve_remote_root = patched_resolve_remote_root
+
+        from debugpy.server import cli
+        cli.main()
+        """
+    ).encode("utf-8"),
+)
+
+
+# The placeholder that `RunRequest` args and env values use for the sandbox root.
+_CHROOT_ROOT = "{chroot}"
 
 
 def _in_chroot(relpath: str) -> str:
-    return os.path.join("{chroot}", relpath)
+    # N.B.: The paths placed in the chroot are always relative, so a plain prefix is equivalent to
+    # `os.path.join(_CHROOT_ROOT, relpath)`.
+    return f"{_CHROOT_ROOT}/{relpath}"
 
 
 @rule_helper
@@ -46,22 +87,23 @@ async def _create_python_source_run_request(
     pex_env: PexEnvironment,
     run_in_sandbox: bool,
     console_script: Optional[ConsoleScript] = None,
-) -> RunRequest:
+) -> tuple[RunRequest, ResolvedPexEntryPoint]:
     addresses = [address]
-    interpreter_constraints, entry_point, transitive_targets = await MultiGet(
+    interpreter_constraints, entry_point = await MultiGet(
         Get(InterpreterConstraints, InterpreterConstraintsRequest(addresses)),
         Get(
             ResolvedPexEntryPoint,
             ResolvePexEntryPointRequest(entry_point_field),
         ),
-        Get(TransitiveTargets, TransitiveTargetsRequest(addresses)),
     )
 
     pex_filename = (
         address.generated_name.replace(".", "_") if address.generated_name else address.target_name
     )
 
-    pex_request, sources = await MultiGet(
+    # N.B.: The local dists only need the interpreter constraints and the sources of the transitive
+    # closure, so we build them concurrently with the main `PexRequest` rather than after it.
+    pex_request, local_dists = await MultiGet(
         Get(
             PexRequest,
             PexFromTargetsRequest(
@@ -80,20 +122,17 @@ async def _create_python_source_run_request(
             ),
         ),
         Get(
-            PythonSourceFiles,
-            PythonSourceFilesRequest(transitive_targets.closure, include_files=True),
-        ),
-    )
-
-    local_dists = await Get(
-        LocalDistsPex,
-        LocalDistsPexRequest(
-            addresses,
-            internal_only=True,
-            interpreter_constraints=interpreter_constraints,
-            sources=sources,
+            LocalDistsPex,
+            LocalDistsPexWithSourcesRequest(
+                addresses,
+                internal_only=True,
+                interpreter_constraints=interpreter_constraints,
+                include_files=True,
+            ),
         ),
     )
+    # The remaining sources keep the source roots of the full transitive closure.
+    sources = local_dists.remaining_sources
     pex_request = dataclasses.replace(
         pex_request, pex_path=(*pex_request.pex_path, local_dists.pex)
     )
@@ -108,83 +147,45 @@ async def _create_python_source_run_request(
         # complexity of figuring out here which sources were codegenned, we copy everything.
         # The inline source roots precede the chrooted ones in PEX_EXTRA_SYS_PATH, so the inline
         # sources will take precedence and their copies in the chroot will be ignored.
-        local_dists.remaining_sources.source_files.snapshot.digest,
+        sources.source_files.snapshot.digest,
     ]
     merged_digest = await Get(Digest, MergeDigests(input_digests))
 
-    chrooted_source_roots = [_in_chroot(sr) for sr in sources.source_roots]
+    chrooted_source_roots = (_in_chroot(sr) for sr in sources.source_roots)
     # The order here is important: we want the in-repo sources to take precedence over their
     # copies in the sandbox (see above for why those copies exist even in non-sandboxed mode).
-    source_roots = [
-        *([] if run_in_sandbox else sources.source_roots),
-        *chrooted_source_roots,
-    ]
+    source_roots = (
+        chrooted_source_roots
+        if run_in_sandbox
+        else itertools.chain(sources.source_roots, chrooted_source_roots)
+    )
     extra_env = {
         **complete_pex_environment.environment_dict(python_configured=venv_pex.python is not None),
         "PEX_EXTRA_SYS_PATH": os.pathsep.join(source_roots),
     }
 
-    return RunRequest(
+    run_request = RunRequest(
         digest=merged_digest,
         args=[_in_chroot(venv_pex.pex.argv0)],
         extra_env=extra_env,
     )
+    return run_request, entry_point
 
 
 @rule_helper
 async def _create_python_source_run_dap_request(
     regular_run_request: RunRequest,
     *,
-    entry_point_field: PexEntryPointField,
+    entry_point: ResolvedPexEntryPoint,
     debugpy: DebugPy,
     debug_adapter: DebugAdapterSubsystem,
     console_script: Optional[ConsoleScript] = None,
 ) -> RunDebugAdapterRequest:
-    entry_point, debugpy_pex, launcher_digest = await MultiGet(
-        Get(
-            ResolvedPexEntryPoint,
-            ResolvePexEntryPointRequest(entry_point_field),
-        ),
+    debugpy_pex, launcher_digest = await MultiGet(
         Get(Pex, PexRequest, debugpy.to_pex_request()),
         Get(
             Digest,
-            CreateDigest(
-                [
-                    FileContent(
-                        "__debugpy_launcher.py",
-                        textwrap.dedent(
-                            """
-                            import os
-                            CHROOT = os.environ["PANTS_CHROOT"]
-
-                            del os.environ["PEX_INTERPRETER"]
-
-                            # See https://github.com/pantsbuild/pants/issues/17540
-                            # For `run --debug-adapter`, the client might send a `pathMappings`
-                            # (this is likely as VS Code likes to configure that by default) with
-                            # a `remoteRoot` of ".". For `run`, CWD is set to the build root, so
-                            # breakpoints set in-repo will never be hit. We fix this by monkeypatching
-                            # pydevd (the library powering debugpy) so that a remoteRoot of "."
-                            # means the sandbox root.
-
-                            import debugpy._vendored.force_pydevd
-                            from _pydevd_bundle.pydevd_process_net_command_json import PyDevJsonCommandProcessor
-                            orig_resolve_remote_root = PyDevJsonCommandProcessor._resolve_remote_root
-
-                            def patched_resolve_remote_root(self, local_root, remote_root):
-                                if remote_root == ".":
-                                    remote_root = CHROOT
-                                return orig_resolve_remote_root(self, local_root, remote_root)
-
-                            PyDevJsonCommandProcessor._resolve_remote_root = patched_resolve_remote_root
-
-                            from debugpy.server import cli
-                            cli.main()
-                            """
-                        ).encode("utf-8"),
-                    ),
-                ]
-            ),
+            CreateDigest([_DEBUGPY_LAUNCHER]),
         ),
     )
 
@@ -198,22 +199,20 @@ async def _create_python_source_run_dap_request(
             ]
         ),
     )
-    extra_env = dict(regular_run_request.extra_env)
-    extra_env["PEX_PATH"] = os.pathsep.join(
-        [
-            extra_env["PEX_PATH"],
-            # For debugpy to work properly, we need to have just one "environment" for our
-            # command to run in. Therefore, we cobble one together with PEX_PATH.
-            _in_chroot(debugpy_pex.name),
-        ]
-    )
-    extra_env["PEX_INTERPRETER"] = "1"
-    extra_env["PANTS_CHROOT"] = _in_chroot("").rstrip("/")
+    regular_pex_path = regular_run_request.extra_env["PEX_PATH"]
+    extra_env = {
+        **regular_run_request.extra_env,
+        # For debugpy to work properly, we need to have just one "environment" for our command to
+        # run in. Therefore, we cobble one together with PEX_PATH.
+        "PEX_PATH": f"{regular_pex_path}{os.pathsep}{_in_chroot(debugpy_pex.name)}",
+        "PEX_INTERPRETER": "1",
+        "PANTS_CHROOT": _CHROOT_ROOT,
+    }
     main = console_script or entry_point.val
     assert main is not None
     args = [
         *regular_run_request.args,
-        _in_chroot("__debugpy_launcher.py"),
+        _in_chroot(_DEBUGPY_LAUNCHER.path),
         *debugpy.get_args(debug_adapter, main),
     ]
 
@@ -17,7 +17,6 @@ from pants.backend.python.target_types import (
 from pants.backend.python.util_rules.pex_environment import PexEnvironment
 from pants.core.goals.run import RunDebugAdapterRequest, RunFieldSet, RunRequest
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
-from pants.engine.internals.selectors import Get
 from pants.engine.rules import collect_rules, rule
 from pants.engine.unions import UnionRule
 from pants.util.logging import LogLevel
@@ -31,20 +30,24 @@ class PythonSourceFieldSet(RunFieldSet):
     run_goal_use_sandbox: PythonRunGoalUseSandboxField
 
 
-@rule(level=LogLevel.DEBUG)
-async def create_python_source_run_request(
-    field_set: PythonSourceFieldSet, pex_env: PexEnvironment, python: PythonSetup
-) -> RunRequest:
+def _run_in_sandbox(field_set: PythonSourceFieldSet, python: PythonSetup) -> bool:
     run_goal_use_sandbox = field_set.run_goal_use_sandbox.value
     if run_goal_use_sandbox is None:
         run_goal_use_sandbox = python.default_run_goal_use_sandbox
+    return run_goal_use_sandbox
 
-    return await _create_python_source_run_request(
+
+@rule(level=LogLevel.DEBUG)
+async def create_python_source_run_request(
+    field_set: PythonSourceFieldSet, pex_env: PexEnvironment, python: PythonSetup
+) -> RunRequest:
+    run_request, _ = await _create_python_source_run_request(
         field_set.address,
         entry_point_field=PexEntryPointField(field_set.source.value, field_set.address),
         pex_env=pex_env,
-        run_in_sandbox=run_goal_use_sandbox,
+        run_in_sandbox=_run_in_sandbox(field_set, python),
     )
+    return run_request
 
 
 @rule
@@ -52,11 +55,20 @@ async def create_python_source_debug_adapter_request(
     field_set: PythonSourceFieldSet,
     debugpy: DebugPy,
     debug_adapter: DebugAdapterSubsystem,
+    pex_env: PexEnvironment,
+    python: PythonSetup,
 ) -> RunDebugAdapterRequest:
-    run_request = await Get(RunRequest, PythonSourceFieldSet, field_set)
+    # N.B.: We build the `RunRequest` directly (rather than via `Get(RunRequest, ...)`) so that the
+    # entry point it resolved can be reused for the debug adapter request.
+    run_request, entry_point = await _create_python_source_run_request(
+        field_set.address,
+        entry_point_field=PexEntryPointField(field_set.source.value, field_set.address),
+        pex_env=pex_env,
+        run_in_sandbox=_run_in_sandbox(field_set, python),
+    )
     return await _create_python_source_run_dap_request(
         run_request,
-        entry_point_field=PexEntryPointField(field_set.source.value, field_set.address),
+        entry_point=entry_point,
         debugpy=debugpy,
         debug_adapter=debug_adapter,
     )
@@ -9,11 +9,15 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from pants.backend.python.subsystems.setuptools import PythonDistributionFieldSet
+from pants.backend.python.util_rules import python_sources
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex import Pex, PexRequest
 from pants.backend.python.util_rules.pex import rules as pex_rules
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
-from pants.backend.python.util_rules.python_sources import PythonSourceFiles
+from pants.backend.python.util_rules.python_sources import (
+    PythonSourceFiles,
+    PythonSourceFilesRequest,
+)
 from pants.build_graph.address import Address
 from pants.core.goals.package import BuiltPackage, PackageFieldSet
 from pants.core.util_rules import system_binaries
@@ -223,9 +227,64 @@ async def build_local_dists(
     return LocalDistsPex(dists_pex, subtracted_sources)
 
 
+@frozen_after_init
+@dataclass(unsafe_hash=True)
+class LocalDistsPexWithSourcesRequest:
+    """Like `LocalDistsPexRequest`, but computes the sources from the dependency closure itself.
+
+    This lets callers request the local dists concurrently with other work, rather than first
+    awaiting the `PythonSourceFiles` to subtract from. The `remaining_sources` of the result retain
+    the source roots of the full set of sources.
+    """
+
+    addresses: Addresses
+    internal_only: bool
+    interpreter_constraints: InterpreterConstraints
+    include_resources: bool
+    include_files: bool
+
+    def __init__(
+        self,
+        addresses: Iterable[Address],
+        *,
+        internal_only: bool,
+        interpreter_constraints: InterpreterConstraints = InterpreterConstraints(),
+        include_resources: bool = True,
+        include_files: bool = False,
+    ) -> None:
+        self.addresses = Addresses(addresses)
+        self.internal_only = internal_only
+        self.interpreter_constraints = interpreter_constraints
+        self.include_resources = include_resources
+        self.include_files = include_files
+
+
+@rule
+async def build_local_dists_with_sources(request: LocalDistsPexWithSourcesRequest) -> LocalDistsPex:
+    transitive_targets = await Get(TransitiveTargets, TransitiveTargetsRequest(request.addresses))
+    sources = await Get(
+        PythonSourceFiles,
+        PythonSourceFilesRequest(
+            transitive_targets.closure,
+            include_resources=request.include_resources,
+            include_files=request.include_files,
+        ),
+    )
+    return await Get(
+        LocalDistsPex,
+        LocalDistsPexRequest(
+            request.addresses,
+            internal_only=request.internal_only,
+            interpreter_constraints=request.interpreter_constraints,
+            sources=sources,
+        ),
+    )
+
+
 def rules():
     return (
         *collect_rules(),
         *pex_rules(),
+        *python_sources.rules(),
         *system_binaries.rules(),
     )
@@ -16,7 +16,11 @@ from pants.backend.python.macros.python_artifact import PythonArtifact
 from pants.backend.python.subsystems.setuptools import rules as setuptools_rules
 from pants.backend.python.target_types import PythonDistribution, PythonSourcesGeneratorTarget
 from pants.backend.python.util_rules import local_dists
-from pants.backend.python.util_rules.local_dists import LocalDistsPex, LocalDistsPexRequest
+from pants.backend.python.util_rules.local_dists import (
+    LocalDistsPex,
+    LocalDistsPexRequest,
+    LocalDistsPexWithSourcesRequest,
+)
 from pants.backend.python.util_rules.python_sources import PythonSourceFiles
 from pants.build_graph.address import Address
 from pants.core.util_rules.source_files import SourceFiles
@@ -33,6 +37,7 @@ def rule_runner() -> RuleRunner:
             *setuptools_rules(),
             *target_types_rules.rules(),
             QueryRule(LocalDistsPex, (LocalDistsPexRequest,)),
+            QueryRule(LocalDistsPex, (LocalDistsPexWithSourcesRequest,)),
         ],
         target_types=[PythonSourcesGeneratorTarget, PythonDistribution],
         objects={"python_artifact": PythonArtifact},
@@ -97,3 +102,44 @@ def test_build_local_dists(rule_runner: RuleRunner) -> None:
 
     # Check that srcroot/foo/bar.py was subtracted out, because the dist provides foo/bar.py.
     assert result.remaining_sources.source_files.files == ("srcroot/foo/qux.py",)
+
+
+def test_build_local_dists_with_sources(rule_runner: RuleRunner) -> None:
+    foo = PurePath("srcroot/foo")
+    rule_runner.write_files(
+        {
+            foo
+            / "BUILD": dedent(
+                """
+            python_sources()
+
+            python_distribution(
+                name = "dist",
+                dependencies = [":foo"],
+                provides = python_artifact(name="foo", version="9.8.7"),
+                sdist = False,
+                generate_setup = False,
+            )
+            """
+            ),
+            foo / "bar.py": "BAR = 42",
+            foo
+            / "setup.py": dedent(
+                """
+                from setuptools import setup
+
+                setup(name="foo", version="9.8.7", packages=["foo"], package_dir={"foo": "."},)
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(["--source-root-patterns=['srcroot']"], env_inherit={"PATH"})
+    request = LocalDistsPexWithSourcesRequest(
+        [Address("srcroot/foo", target_name="dist")], internal_only=True
+    )
+    result = rule_runner.request(LocalDistsPex, [request])
+
+    assert result.pex is not None
+    # The sources are computed from the closure, and those provided by the dist are subtracted out.
+    assert result.remaining_sources.source_roots == ("srcroot",)
+    assert "srcroot/foo/bar.py" not in result.remaining_sources.source_files.files
@@ -162,7 +162,10 @@ class DaemonPantsRunner:
         ):
             # NB: `single_daemonized_run` implements exception handling, so only the most primitive
             # errors will escape this function, where they will be logged by the server.
-            logger.info(f"handling request: `{' '.join(args)}`")
+            # NB: The args may be very long (e.g. for `list ::`), so they are only joined once, and
+            # only if they will actually be logged.
+            joined_args = " ".join(args) if logger.isEnabledFor(logging.INFO) else ""
+            logger.info(f"handling request: `{joined_args}`")
             try:
                 with stdio_destination(
                     stdin_fileno=stdin_fileno,
@@ -171,4 +174,4 @@ class DaemonPantsRunner:
                 ):
                     return self.single_daemonized_run(((command,) + args), env, cancellation_latch)
             finally:
-                logger.info(f"request completed: `{' '.join(args)}`")
+                logger.info(f"request completed: `{joined_args}`")